@@ -1,5 +1,13 @@
-import requests
+import atexit
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 from .models import TOKEN_PATH
 from .exceptions import (
@@ -13,22 +21,147 @@ from .exceptions import (
     MissingApiTokenError,
 )
 
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from urllib3.connectionpool import ConnectionPool
+    from urllib3.response import BaseHTTPResponse
+
+_SUCCESS_NO_BODY = frozenset({201, 202, 204})
+_STATUS_EXCEPTIONS = {
+    400: BadRequestError,
+    401: UnauthorizedError,
+    403: ForbiddenError,
+    404: NotFoundError,
+    429: RateLimitError,
+    500: InternalServerError,
+    502: InternalServerError,
+    503: InternalServerError,
+    504: InternalServerError,
+}
+
+
+@lru_cache(maxsize=1)
+def _cached_token(mtime_ns: int) -> str | None:
+    """Reads access token from disk; cached as long as the file is not modified"""
+    with open(TOKEN_PATH, "r") as f:
+        return json.load(f).get("access_token")
+
+
+def _parse(response: requests.Response, default: Any = None) -> Any:
+    """Decodes JSON body straight from raw bytes, skipping requests' charset
+    detection; returns default when body is not valid JSON
+    """
+    if not (content := response.content):
+        return default
+
+    try:
+        return json.loads(content)
+    except ValueError:
+        return default
+
+
+class _SpotifyRetry(Retry):
+    """Retry policy resending non-idempotent POSTs only when rate limited
+    and giving up on Retry-After longer than backoff_max
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        # a POST failing with 5xx may have been applied already (e.g. skipped
+        # track), resending it would repeat the write; 429 is never processed
+        if method.upper() == "POST":
+            return status_code == 429
+
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: "BaseHTTPResponse | None" = None,
+        error: Exception | None = None,
+        _pool: "ConnectionPool | None" = None,
+        _stacktrace: "TracebackType | None" = None,
+    ) -> "_SpotifyRetry":
+        # Retry-After is slept as sent, uncapped by backoff_max; rather than
+        # hang for hours return the response, so _request raises RateLimitError
+        if response is not None and (
+            (retry_after := self.get_retry_after(response)) is not None
+            and retry_after > self.backoff_max
+        ):
+            reason = ResponseError(f"Retry-After {retry_after}s exceeds backoff_max")
+            raise MaxRetryError(_pool, url, reason)
+
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def gather(*calls: Callable[[], Any]) -> list[Any]:
+    """Runs given calls concurrently, results are returned in the order of calls"""
+    if len(calls) == 1:
+        return [calls[0]()]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
 
 class SpotifyAPI:
     BASE_URL = "https://api.spotify.com/v1"
 
+    # shared by all instances, so keep-alive connections survive across them
+    _session: ClassVar[requests.Session | None] = None
+
     def __init__(self):
         self.access_token = self._load_tokens()
-        self.headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        self.session = self._get_session()
+        self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Returns shared session, creating it on first use"""
+        if cls._session is None:
+            cls._session = cls._create_session()
+            atexit.register(cls.close)
+        return cls._session
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Creates session reusing one keep-alive connection for all API calls"""
+        # Retry rate limited and transient server errors transparently, honouring
+        # Retry-After; once exhausted the last response is handled by _request.
+        # 5xx, 504 gateway timeouts above all, may come after the write was
+        # applied, so they are retried only for idempotent methods
+        retry = _SpotifyRetry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+
+        return session
+
+    @classmethod
+    def close(cls) -> None:
+        """Closes shared session and releases pooled connections"""
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
 
     def _load_tokens(self) -> str | None:
-        if TOKEN_PATH.exists():
-            with open(TOKEN_PATH, "r") as f:
-                return json.load(f).get("access_token")
-        raise MissingApiTokenError()
+        try:
+            return _cached_token(TOKEN_PATH.stat().st_mtime_ns)
+        except FileNotFoundError:
+            raise MissingApiTokenError()
 
     def _request(
         self, method: str, endpoint: str, params: dict = None, data: dict = None
@@ -37,41 +170,41 @@ class SpotifyAPI:
 
         url = f"{self.BASE_URL}/{endpoint}"
 
-        response = requests.request(
+        response = self.session.request(
             method,
             url,
-            headers=self.headers,
             params=params,
-            data=json.dumps(data) if data else None,
+            json=data or None,
         )
 
-        match response.status_code:
-            case 200:
-                try:
-                    return response.json()
-                except requests.exceptions.JSONDecodeError:
-                    return response.content
-            case 201 | 202 | 204:
-                return None
-            case 400:
-                raise BadRequestError(response.json())
-            case 401:
-                raise UnauthorizedError(response.json())
-            case 403:
-                raise ForbiddenError(response.json())
-            case 404:
-                raise NotFoundError(response.json())
-            case 429:
-                raise RateLimitError(response.json())
-            case 500 | 502 | 503:
-                raise InternalServerError(response.json())
-            case _:
-                raise SpotliAPIException(response.json())
+        status_code = response.status_code
+
+        if status_code == 200:
+            return _parse(response, default=response.content)
+
+        if status_code in _SUCCESS_NO_BODY:
+            return None
+
+        # fallback for e.g. HTML error pages returned by the gateway
+        # or JSON bodies that are not an error object
+        if not isinstance(payload := _parse(response), dict) or not payload:
+            payload = {"error": {"status": status_code, "message": response.text[:200]}}
+
+        exception = _STATUS_EXCEPTIONS.get(status_code, SpotliAPIException)
+        raise exception(payload)
 
     def get(self, endpoint: str, data: dict = None, params: dict = None) -> dict | None:
         """GET request to specified endpoint with given params"""
         return self._request("GET", endpoint, data=data, params=params)
 
+    def get_many(self, calls: list[tuple[str, dict | None]]) -> list[dict | None]:
+        """Concurrent GET requests to specified (endpoint, params) pairs,
+        results are returned in the order of given calls
+        """
+        return gather(
+            *(partial(self.get, endpoint, params=params) for endpoint, params in calls)
+        )
+
     def post(self, endpoint: str, data: dict = None, params: dict = None) -> dict | None:
         """POST request to specified endpoint with given params"""
         return self._request("POST", endpoint, data=data, params=params)
@@ -1,9 +1,11 @@
 import json
+import logging
+import time
 from base64 import b64encode
-from datetime import datetime, timedelta
+from datetime import datetime
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import NoReturn
-from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 import click
 import requests
@@ -13,12 +15,17 @@ from .exceptions import AuthorizationError, MissingRequiredArgumentsError
 
 AUTH_URL = "https://accounts.spotify.com/authorize"
 TOKEN_URL = "https://accounts.spotify.com/api/token"
+CALLBACK_TIMEOUT = 60  # seconds to wait for the authorization callback
+CALLBACK_BODY = b"<script>window.close()</script>"
 SCOPES = [
     "user-read-private",
     "user-read-email",
     "user-read-playback-state",
     "user-read-recently-played",
 ]
+SCOPES_STR = " ".join(SCOPES)
+
+logger = logging.getLogger("spotli")
 
 
 class SpotifyAuth:
@@ -26,6 +33,16 @@ class SpotifyAuth:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self._redirect_port = urlsplit(redirect_uri).port if redirect_uri else None
+        self._basic_auth_header = None
+
+    @property
+    def basic_auth(self) -> str:
+        """Basic authorization header value, computed once per instance"""
+        if self._basic_auth_header is None:
+            credentials = f"{self.client_id}:{self.client_secret}".encode()
+            self._basic_auth_header = f"Basic {b64encode(credentials).decode()}"
+        return self._basic_auth_header
 
     def _check_arguments(self):
         arg_dict = {
@@ -42,25 +59,21 @@ class SpotifyAuth:
     def _save_tokens(self, tokens: dict) -> NoReturn:
         TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        # add expires_at
-        tokens["expires_at"] = (
-            datetime.now() + timedelta(seconds=tokens["expires_in"])
-        ).strftime("%Y-%m-%dT%H:%M:%S")
+        # add expires_at as unix timestamp
+        tokens["expires_at"] = int(time.time()) + tokens["expires_in"]
 
         with open(TOKEN_PATH, "w") as f:
             json.dump(tokens, f)
 
     def _load_tokens(self) -> dict | None:
-        if TOKEN_PATH.exists():
+        try:
             with open(TOKEN_PATH, "r") as f:
                 return json.load(f)
-        return None
+        except FileNotFoundError:
+            return None
 
     def _request_access_token(self, code: dict) -> dict:
-        auth_header = b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode()
-        headers = {"Authorization": f"Basic {auth_header}"}
+        headers = {"Authorization": self.basic_auth}
         data = {
             "grant_type": "authorization_code",
             "code": code,
@@ -71,10 +84,7 @@ class SpotifyAuth:
         return response.json()
 
     def _refresh_access_token(self, refresh_token: str) -> dict:
-        auth_header = b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode()
-        headers = {"Authorization": f"Basic {auth_header}"}
+        headers = {"Authorization": self.basic_auth}
         data = {
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
@@ -84,16 +94,18 @@ class SpotifyAuth:
         return response.json()
 
     def get_access_token(self) -> dict:
-        click.echo("Checking for token existance...")
+        logger.info("Checking for token existance...")
         tokens = self._load_tokens()
         if tokens:
-            click.echo("Token already exists, checking if need for refresh... ")
+            logger.info("Token already exists, checking if need for refresh...")
             # Refresh token if expired
-            expires_at = datetime.strptime(
-                tokens.get("expires_at"), "%Y-%m-%dT%H:%M:%S"
-            )
+            expires_at = tokens.get("expires_at")
 
-            if expires_at < datetime.now():
+            # tokens saved by older versions store expires_at as local ISO date
+            if isinstance(expires_at, str):
+                expires_at = datetime.fromisoformat(expires_at).timestamp()
+
+            if expires_at < time.time():
                 self._check_arguments()
                 new_tokens = self._refresh_access_token(tokens["refresh_token"])
                 tokens.update(new_tokens)
@@ -104,7 +116,7 @@ class SpotifyAuth:
 
             return tokens["access_token"]
 
-        click.echo("Token doesn't exist, requesting new one")
+        logger.info("Token doesn't exist, requesting new one")
         self._check_arguments()
         # Start new authorization flow
         return self._start_authorization_flow()
@@ -114,7 +126,7 @@ class SpotifyAuth:
             "client_id": self.client_id,
             "response_type": "code",
             "redirect_uri": self.redirect_uri,
-            "scope": " ".join(SCOPES),
+            "scope": SCOPES_STR,
         }
         auth_url = f"{AUTH_URL}?{urlencode(auth_params)}"
         click.echo(f"Open this URL in your browser to authorize the app:\n{auth_url}")
@@ -126,17 +138,34 @@ class SpotifyAuth:
                 return
 
             def do_GET(self):
-                parsed_url = urlparse(self.path)
+                parsed_url = urlsplit(self.path)
                 query = parse_qs(parsed_url.query)
+                # browsers may hit the server first with unrelated requests
+                # (e.g. favicon), only the callback carries `code` or `error`
                 self.server.code = query.get("code", [None])[0]
+                self.server.denied = "error" in query
                 self.send_response(200)
+                # let the browser drop the socket instead of keeping it alive
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(CALLBACK_BODY)))
+                self.send_header("Connection", "close")
                 self.end_headers()
-                self.wfile.write(b"<script>window.close()</script>")
-
-        port = urlparse(self.redirect_uri).port
+                self.wfile.write(CALLBACK_BODY)
+
+        server = HTTPServer(("localhost", self._redirect_port), CallbackHandler)
+        server.code = None
+        server.denied = False
+        deadline = time.monotonic() + CALLBACK_TIMEOUT
+
+        try:
+            while server.code is None and not server.denied:
+                server.timeout = deadline - time.monotonic()
+                if server.timeout <= 0:
+                    break
+                server.handle_request()
+        finally:
+            server.server_close()
 
-        server = HTTPServer(("localhost", port), CallbackHandler)
-        server.handle_request()
         code = server.code
 
         if not code:
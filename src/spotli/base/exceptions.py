@@ -1,6 +1,3 @@
-from .models import TOKEN_PATH
-
-
 class BaseSpotliException(Exception):
     """Base Spotli Exception"""
 
@@ -12,6 +9,8 @@ class MissingApiTokenError(BaseSpotliException):
         super().__init__()
 
     def __str__(self):
+        from .models import TOKEN_PATH
+
         return f"No token available at {TOKEN_PATH}. Request new with 'spotli auth'."
 
 
@@ -41,13 +40,26 @@ class MissingRequiredArgumentsError(BaseSpotliException):
 class SpotliAPIException(BaseSpotliException):
     """General API call Exception"""
 
+    message: str | None = None
+
     def __init__(self, response: dict):
         super().__init__()
-        self.status = response["error"]["status"]
-        self.response_message = response["error"]["message"]
+        error = response.get("error", {})
+
+        # authorization errors carry error code and description instead
+        if not isinstance(error, dict):
+            error = {"message": response.get("error_description", error)}
+
+        self.status = error.get("status", "?")
+        self.response_message = error.get("message", "")
+
+        prefix = f"{self.message}; " if self.message else ""
+        self._str = (
+            f"{prefix}SpotliAPIException[{self.status}] - {self.response_message}"
+        )
 
     def __str__(self):
-        return f"SpotliAPIException[{self.status}] - {self.response_message}"
+        return self._str
 
 
 class BadRequestError(SpotliAPIException):
@@ -55,12 +67,7 @@ class BadRequestError(SpotliAPIException):
     server due to malformed syntax.
     """
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Bad Request"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Bad Request"
 
 
 class UnauthorizedError(SpotliAPIException):
@@ -69,12 +76,7 @@ class UnauthorizedError(SpotliAPIException):
     authorization has been refused for those credentials.
     """
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Unauthorized"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Unauthorized"
 
 
 class ForbiddenError(SpotliAPIException):
@@ -82,12 +84,7 @@ class ForbiddenError(SpotliAPIException):
     but is refusing to fulfill it.
     """
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Forbidden"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Forbidden"
 
 
 class NotFoundError(SpotliAPIException):
@@ -95,31 +92,16 @@ class NotFoundError(SpotliAPIException):
     This error can be due to a temporary or permanent condition.
     """
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Not Found"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Not Found"
 
 
 class RateLimitError(SpotliAPIException):
     """Too Many Requests - Rate limiting has been applied."""
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Too Many Requests"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Too Many Requests"
 
 
 class InternalServerError(SpotliAPIException):
     """Container for all Internal Server Errors"""
 
-    def __init__(self, response: dict):
-        super().__init__(response)
-        self.message = "Internal Server Error"
-
-    def __str__(self):
-        return f"{self.message}; " + super().__str__()
+    message = "Internal Server Error"
@@ -1,50 +1,77 @@
 import re
 from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Type, TypeVar, get_args, get_origin
+from typing import Any, Callable, Type, TypeVar, get_args, get_origin
 
 import click
 
 TOKEN_PATH = Path.home() / ".spotli" / "tokens.json"
 
+_SPOTIFY_URI_RE = re.compile(
+    r"spotify:(track|album|artist|playlist|show|episode):[a-zA-Z0-9]+"
+)
+
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _inspect_type(field_type: Any) -> tuple[bool, bool, Any]:
+    """Resolves (is dataclass, is list of dataclasses, list item type) for given type"""
+    if get_origin(field_type) is list:
+        inner_type = get_args(field_type)[0]
+        return False, is_dataclass(inner_type), inner_type
+    return is_dataclass(field_type), False, None
+
+
+@lru_cache(maxsize=None)
+def _compile_from_dict(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """Generates straight-line constructor of given dataclass from dictionary,
+    so fields are introspected once per class instead of once per instance
+    """
+    namespace = {"cls": cls}
+    lines = ["def from_dict(data):", "    init_kwargs = {}"]
+
+    for i, field in enumerate(fields(cls)):
+        is_dc, is_dc_list, inner_type = _inspect_type(field.type)
+
+        lines.append(f"    if {field.name!r} in data:")
+        lines.append(f"        value = data[{field.name!r}]")
+
+        # Handle nested dataclass
+        if is_dc:
+            namespace[f"type_{i}"] = field.type
+            lines.append("        if isinstance(value, dict):")
+            lines.append(f"            value = type_{i}.from_dict(value)")
+
+        # Handle list of dataclasses
+        elif is_dc_list:
+            namespace[f"type_{i}"] = inner_type
+            lines.append("        if isinstance(value, list):")
+            lines.append(f"            value = [type_{i}.from_dict(x) for x in value]")
+
+        # Other fields (primitives, lists of primitives or non-dataclass objects)
+        # are passed as they are
+        lines.append(f"        init_kwargs[{field.name!r}] = value")
+
+    lines.append("    return cls(**init_kwargs)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["from_dict"]
+
+
 class FromDictMixin:
+    # keeps slotted dataclasses using this mixin free of instance __dict__
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls: Type[T], data: dict[str, Any]) -> T | None:
         """Creates class instance unpacking given dictionary"""
 
-        field_names = {f.name for f in fields(cls)}
-        init_kwargs = {}
-
         if not data:
             return None
 
-        for key, value in data.items():
-            if key in field_names:
-                field = next(f for f in fields(cls) if f.name == key)
-                field_type = field.type
-
-                # Handle nested dataclass
-                if is_dataclass(field_type) and isinstance(value, dict):
-                    init_kwargs[key] = field_type.from_dict(value)
-
-                # Handle list of dataclasses
-                elif get_origin(field_type) is list:
-                    inner_type = get_args(field_type)[0]
-                    if is_dataclass(inner_type) and isinstance(value, list):
-                        init_kwargs[key] = [
-                            inner_type.from_dict(item) for item in value
-                        ]
-                    else:
-                        init_kwargs[key] = value  # List of primitives
-
-                # Handle other fields (primitives or non-dataclass objects)
-                else:
-                    init_kwargs[key] = value
-
-        return cls(**init_kwargs)
+        return _compile_from_dict(cls)(data)
 
 
 class SpotifyURI(click.ParamType):
@@ -52,12 +79,7 @@ class SpotifyURI(click.ParamType):
 
     name = "spotify_uri"
 
-    def __init__(self):
-        self.pattern = re.compile(
-            r"^spotify:(track|album|artist|playlist|show|episode):[a-zA-Z0-9]+$"
-        )
-
     def convert(self, value, param, ctx) -> str:
-        if isinstance(value, str) and self.pattern.match(value):
+        if isinstance(value, str) and _SPOTIFY_URI_RE.fullmatch(value):
             return value
         self.fail(f"{value} is not a valid Spotify URI.", param, ctx)
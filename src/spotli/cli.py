@@ -1,17 +1,67 @@
+import logging
 import sys
+from importlib import import_module
+
 import click
 
-from .base.authorization import auth
-from .player.commands import player
 
-from dotenv import load_dotenv
+class ClickHandler(logging.Handler):
+    """Logging handler writing records to stderr through click"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        click.echo(self.format(record), err=True)
+
+
+class LazyGroup(click.Group):
+    """Group importing its subcommands only when they are requested"""
+
+    def __init__(
+        self, *args, lazy_subcommands: dict[str, tuple[str, str]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        # {command name: ("import.path.to.command", "short help")}
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx) -> list[str]:
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-load_dotenv()
+    def format_commands(self, ctx, formatter) -> None:
+        # lazy commands are listed with their stored help, so that root --help
+        # does not import them just to read their docstrings
+        rows = [(name, help) for name, (_, help) in self.lazy_subcommands.items()]
+        for name in super().list_commands(ctx):
+            command = super().get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str()))
 
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(sorted(rows))
 
-@click.group()
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, command_name = import_path.rsplit(".", 1)
+        return getattr(import_module(module_name), command_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "auth": (
+            "spotli.base.authorization.auth",
+            "Authenticate user using oAuth and create access token",
+        ),
+        "player": ("spotli.player.commands.player", "Manage Spotify's web player"),
+    },
+)
 @click.option("--debug", is_flag=True, help="Display full error traceback")
-def cli(debug):
+@click.option("-v", "--verbose", is_flag=True, help="Display progress messages")
+def cli(debug, verbose):
     """Simple python cli tool to manage your Spotify sessions from within the terminal.
 
     As this tool performs all operation via Spotify API, you need constant
@@ -21,13 +71,23 @@ def cli(debug):
     Before you start, authenticate yourself with `spotli auth`.
 
     For detailed traceback put --debug right after `spotli` command.
+    For progress messages put --verbose right after `spotli` command.
     """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    logger = logging.getLogger("spotli")
+    # callback may run more than once per process, e.g. under CliRunner
+    if not any(isinstance(handler, ClickHandler) for handler in logger.handlers):
+        logger.addHandler(ClickHandler())
+    logger.setLevel(
+        logging.DEBUG if debug else logging.INFO if verbose else logging.WARNING
+    )
+
     if not debug:
         sys.tracebacklimit = 0
 
 
-cli.add_command(auth)
-cli.add_command(player)
-
 if __name__ == "__main__":
     cli()
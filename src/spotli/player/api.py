@@ -1,26 +1,95 @@
+import threading
+import time
 from typing import NoReturn
 
 from ..base.models import SpotifyURI
 from ..base.api import SpotifyAPI
 from .models import Device, PlaybackState, Track
 
+STATE_TTL = 0.5  # seconds for which fetched playback state is reused
+DEVICES_TTL = 60.0  # seconds for which fetched devices list is reused
+
 
 class PlayerApi:
     def __init__(self):
         self.spotify_api = SpotifyAPI()
         self.endpoint = "me/player"
+        self._ep_devices = f"{self.endpoint}/devices"
+        self._ep_play = f"{self.endpoint}/play"
+        self._ep_pause = f"{self.endpoint}/pause"
+        self._ep_next = f"{self.endpoint}/next"
+        self._ep_previous = f"{self.endpoint}/previous"
+        self._ep_seek = f"{self.endpoint}/seek"
+        self._ep_repeat = f"{self.endpoint}/repeat"
+        self._ep_volume = f"{self.endpoint}/volume"
+        self._ep_shuffle = f"{self.endpoint}/shuffle"
+        self._ep_recent = f"{self.endpoint}/recently-played"
+        self._ep_queue = f"{self.endpoint}/queue"
+        self._ttl = {self.endpoint: STATE_TTL, self._ep_devices: DEVICES_TTL}
+        self._cache: dict[str, tuple[float, dict | None]] = {}
+        self._generation = 0  # bumped on every invalidation
+        # writes and reads may run on gather() worker threads at the same time
+        self._lock = threading.Lock()
+
+    def _get_cached(self, *endpoints: str) -> list[dict | None]:
+        """GET given endpoints reusing responses younger than their TTL,
+        the missing ones are fetched concurrently
+        """
+        now = time.monotonic()
+        results = {}
+
+        with self._lock:
+            for endpoint in endpoints:
+                entry = self._cache.get(endpoint)
+                if entry and now - entry[0] < self._ttl[endpoint]:
+                    results[endpoint] = entry[1]
+            generation = self._generation
+
+        if missing := [endpoint for endpoint in endpoints if endpoint not in results]:
+            responses = self.spotify_api.get_many([(e, None) for e in missing])
+            fetched_at = time.monotonic()
+
+            with self._lock:
+                for endpoint, response in zip(missing, responses):
+                    # a write finished meanwhile (e.g. play fetching status
+                    # alongside), so the response may predate it; don't reuse it
+                    if generation == self._generation:
+                        self._cache[endpoint] = (fetched_at, response)
+                    results[endpoint] = response
+
+        return [results[endpoint] for endpoint in endpoints]
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached responses of endpoints starting with given prefix"""
+        with self._lock:
+            self._generation += 1
+            for endpoint in [e for e in self._cache if e.startswith(prefix)]:
+                self._cache.pop(endpoint, None)
 
     def get_playback_state(self) -> PlaybackState | None:
         """Get information about the user's current playback state"""
         endpoint = self.endpoint
 
-        response = self.spotify_api.get(endpoint)
+        (response,) = self._get_cached(endpoint)
 
         if response:
             return PlaybackState.from_dict(response)
 
         return None
 
+    def get_state_and_devices(self) -> tuple[PlaybackState | None, list[Device] | None]:
+        """Get playback state and available devices with concurrent requests"""
+        state, devices = self._get_cached(self.endpoint, self._ep_devices)
+
+        state = PlaybackState.from_dict(state) if state else None
+        devices = (
+            [Device.from_dict(device) for device in devices.get("devices")]
+            if devices
+            else None
+        )
+
+        return state, devices
+
     def transfer_playback(self, id: str) -> NoReturn:
         """Transfer playback to a new device"""
         endpoint = self.endpoint
@@ -28,12 +97,13 @@ class PlayerApi:
         data = {"device_ids": [id], "play": False}
 
         self.spotify_api.put(endpoint, data=data)
+        self.invalidate(self.endpoint)
 
     def get_available_devices(self) -> list[Device] | None:
         """Get information about a user's available Spotify Connect devices"""
-        endpoint = self.endpoint + "/devices"
+        endpoint = self._ep_devices
 
-        response = self.spotify_api.get(endpoint)
+        (response,) = self._get_cached(endpoint)
 
         if response:
             return [Device.from_dict(device) for device in response.get("devices")]
@@ -45,71 +115,79 @@ class PlayerApi:
 
     def start_resume_playback(self, id: str = None) -> NoReturn:
         """Start a new context or resume current playback on the user's active device"""
-        endpoint = self.endpoint + "/play"
+        endpoint = self._ep_play
 
         params = {"device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def pause_playback(self, id: str = None) -> NoReturn:
         """Pause playback on the user's account"""
-        endpoint = self.endpoint + "/pause"
+        endpoint = self._ep_pause
 
         params = {"device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def skip_to_next(self, id: str = None) -> NoReturn:
         """Skips to next track in the user's queue"""
-        endpoint = self.endpoint + "/next"
+        endpoint = self._ep_next
 
-        params = {"devide_id": id}
+        params = {"device_id": id}
 
         self.spotify_api.post(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def skip_to_previous(self, id: str = None) -> NoReturn:
         """Skips to previous track in the user's queue"""
-        endpoint = self.endpoint + "/previous"
+        endpoint = self._ep_previous
 
-        params = {"devide_id": id}
+        params = {"device_id": id}
 
         self.spotify_api.post(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def seek_to_position(self, time: int, id: str = None) -> NoReturn:
         """Seeks to the given position in the user's currently playing track"""
-        endpoint = self.endpoint + "/seek"
+        endpoint = self._ep_seek
 
-        params = {"position_ms": time, "devide_id": id}
+        params = {"position_ms": time, "device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def set_repeat_mode(self, value: str, id: str = None) -> NoReturn:
         """Set the repeat mode for the user's playback"""
-        endpoint = self.endpoint + "/repeat"
+        endpoint = self._ep_repeat
 
         params = {"state": value, "device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def set_playback_volume(self, value: int, id: str = None) -> NoReturn:
         """Set the volume for the user's current playback device"""
-        endpoint = self.endpoint + "/volume"
+        endpoint = self._ep_volume
 
         params = {"volume_percent": value, "device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def toggle_playback_shuffle(self, state: bool, id: str = None) -> NoReturn:
         """Toggle shuffle on or off for user's playback"""
-        endpoint = self.endpoint + "/shuffle"
+        endpoint = self._ep_shuffle
 
         params = {"state": state, "device_id": id}
 
         self.spotify_api.put(endpoint, params=params)
+        self.invalidate(self.endpoint)
 
     def get_recently_played_tracks(self, limit: int) -> list[Track] | None:
         """Get tracks from the current user's recently played tracks"""
-        endpoint = self.endpoint + "/recently-played"
+        endpoint = self._ep_recent
 
         params = {
             "limit": limit,
@@ -124,21 +202,22 @@ class PlayerApi:
 
     def get_user_queue(self) -> list[Track]:
         """Get the list of objects that make up the user's queue"""
-        endpoint = self.endpoint + "/queue"
+        endpoint = self._ep_queue
 
         response = self.spotify_api.get(endpoint) or {}
 
         currently_playing = Track.from_dict(response.get("currently_playing"))
-        queue = [currently_playing] + [
-            Track.from_dict(x) for x in response.get("queue")
-        ]
 
-        return queue
+        # nothing is playing, so there is no queue either
+        if not currently_playing:
+            return []
+
+        return [currently_playing, *map(Track.from_dict, response.get("queue") or [])]
 
     def add_item_to_queue(self, uri: SpotifyURI, id: str = None) -> NoReturn:
         """Add an item to the end of the user's current playback queue"""
-        endpoint = self.endpoint + "/queue"
+        endpoint = self._ep_queue
 
-        params = {"uri": uri, "id": id}
+        params = {"uri": uri, "device_id": id}
 
         self.spotify_api.post(endpoint, params=params)
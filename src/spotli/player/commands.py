@@ -3,6 +3,9 @@ import click
 from ..base.models import SpotifyURI
 from .player import Player
 
+# Player shared by all commands of single cli run, created on first use
+pass_player = click.make_pass_decorator(Player, ensure=True)
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -17,30 +20,27 @@ def player(ctx):
 
 @player.command()
 @click.option("--short", is_flag=True, help="If set, displayes status in short form")
-def status(short):
+@pass_player
+def status(player, short):
     """Displays status of the current active Device"""
-    player = Player()
-
     result = player.status() if not short else player.status_short()
 
     click.echo(result)
 
 
 @player.command()
-def play():
+@pass_player
+def play(player):
     """Starts playback; Targets current active session"""
-    player = Player()
-
     result = player.play()
 
     click.echo(result)
 
 
 @player.command()
-def pause():
+@pass_player
+def pause(player):
     """Pause playback; Targets current active session"""
-    player = Player()
-
     result = player.pause()
 
     click.echo(result)
@@ -48,33 +48,30 @@ def pause():
 
 @player.command(context_settings={"ignore_unknown_options": True})
 @click.argument("value", type=int, nargs=1)
-def volume(value):
+@pass_player
+def volume(player, value):
     """Change volume of current active session to <VALUE>"""
 
-    player = Player()
-
     result = player.volume(value)
 
     click.echo(result)
 
 
 @player.command()
-def next():
+@pass_player
+def next(player):
     """Skips to next track in the user's queue"""
 
-    player = Player()
-
     result = player.next()
 
     click.echo(result)
 
 
 @player.command()
-def previous():
+@pass_player
+def previous(player):
     """Skips to previous track in the user's queue"""
 
-    player = Player()
-
     result = player.previous()
 
     click.echo(result)
@@ -82,11 +79,10 @@ def previous():
 
 @player.command()
 @click.argument("value", type=click.DateTime(formats=["%H:%M:%S", "%M:%S"]), nargs=1)
-def seek(value):
+@pass_player
+def seek(player, value):
     """Seek to the given <VALUE> in the currently playing track; Format 00:00:00 or 00:00."""
 
-    player = Player()
-
     result = player.seek(value)
 
     click.echo(result)
@@ -98,86 +94,98 @@ def seek(value):
     type=click.Choice(["track", "context", "off"], case_sensitive=False),
     nargs=1,
 )
-def repeat(value):
+@pass_player
+def repeat(player, value):
     """Set player to repeat mode\n
     `track` - repeat current track\n
     `context` - repeat current context (album, queue)\n
     `off` - turns off repeat mode
     """
 
-    player = Player()
-
     result = player.repeat(value)
 
     click.echo(result)
 
 
 @player.command()
-def devices():
+@pass_player
+def devices(player):
     """Returns list of available Spotify Connect devices\n
     🟢 active     | inactive     🔴\n
     🙈 private    | unprivate    🐵\n
     🔐 restricted | unrestricted 🔓
     """
 
-    player = Player()
-
     result = player.devices()
 
-    for device in result.values():
+    for device in result:
         click.echo(device[1])
 
 
 @player.command()
-def transfer():
+@pass_player
+def transfer(player):
     """Transfer playback to a new device and optionally begin playback
 
     If no target id is provided, displays list of possible targets
     """
 
-    player = Player()
-
-    result = player.devices()
-    for device in result.values():
+    status, result = player.devices_with_status()
+    click.echo(status)
+    for device in result:
         click.echo(device[1])
 
     choice = click.prompt("Provide device number (n) or pass x to exit", type=int)
-    if not (id := result.get(choice, None)):
+    if not 1 <= choice <= len(result):
         raise click.Abort()
 
-    result = player.transfer(id[0])
+    result = player.transfer(result[choice - 1][0])
 
     click.echo(result)
 
 
 @player.command()
-def shuffle():
-    """Toggle shuffle on or off for user's playback"""
+@click.argument(
+    "value",
+    type=click.Choice(["on", "off"], case_sensitive=False),
+    required=False,
+    default=None,
+    nargs=1,
+)
+@pass_player
+def shuffle(player, value):
+    """Toggle shuffle on or off for user's playback
 
-    player = Player()
+    If <VALUE> is passed, sets shuffle to given state without checking current one.
+    """
 
-    result = player.shuffle()
+    match value and value.lower():
+        case "on":
+            result = player.shuffle_on()
+        case "off":
+            result = player.shuffle_off()
+        case _:
+            result = player.shuffle()
 
     click.echo(result)
 
 
 @player.command()
 @click.argument("uri", type=SpotifyURI(), required=False, default=None, nargs=1)
-def queue(uri):
+@pass_player
+def queue(player, uri):
     """Get the list of objects that make up the user's queue or add given one
 
     If no argument is passed, displays current user's queue.
     Otherwise will attempt to add new item to queue. Works only with valid Spotify uri.
     """
 
-    player = Player()
-
     if not (result := player.queue()):
         click.echo("No active device found")
         return
 
     if uri:
-        result = player.add_queue(uri, id)
+        result = player.add_queue(uri)
         click.echo(result)
         return
 
@@ -186,29 +194,26 @@ def queue(uri):
 
     click.echo(f"-> {current}")
 
-    starts = 1
-    while queue:
-        for idx, i in enumerate(range(5), start=starts):
-            try:
-                click.echo(f" ({idx}) {queue.pop(i)}")
-            except IndexError:
-                break
-        else:
-            click.echo("(more)")
-            if not ("y" == click.prompt("Do you want to continue? (y/n)", type=str)):
-                raise click.Abort()
-            starts += 5
-            click.echo("\033[F\033[K" * 7, nl=False)  # clear last line
+    for cursor in range(0, len(queue), 5):
+        for idx, track in enumerate(queue[cursor : cursor + 5], start=cursor + 1):
+            click.echo(f" ({idx}) {track}")
+
+        if cursor + 5 >= len(queue):
+            break
+
+        click.echo("(more)")
+        if not ("y" == click.prompt("Do you want to continue? (y/n)", type=str)):
+            raise click.Abort()
+        click.echo("\033[F\033[K" * 7, nl=False)  # clear last page
 
 
 @player.command()
 @click.option(
     "--limit", default=10, type=click.IntRange(1, 50), help="Limit displayed songs"
 )
-def recent(limit):
+@pass_player
+def recent(player, limit):
     """Displays last -n songs for active session, default 10"""
-    player = Player()
-
     result = player.recent(limit)
 
     for song in result:
@@ -4,7 +4,7 @@ from typing import Any
 from ..base.models import FromDictMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(FromDictMixin):
     id: str
     is_active: bool
@@ -16,7 +16,7 @@ class Device(FromDictMixin):
     supports_volume: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(FromDictMixin):
     external_urls: dict[str, str]
     href: str
@@ -26,7 +26,7 @@ class Artist(FromDictMixin):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(FromDictMixin):
     album_type: str
     total_tracks: int
@@ -40,7 +40,7 @@ class Album(FromDictMixin):
     artists: list[Artist]
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(FromDictMixin):
     album: Album
     artists: list[Artist]
@@ -53,7 +53,7 @@ class Track(FromDictMixin):
     popularity: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybackState(FromDictMixin):
     device: Device
     repeat_state: str
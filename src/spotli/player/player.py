@@ -1,15 +1,39 @@
-import shutil
-from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
+from ..base.api import gather
 from ..base.models import SpotifyURI
 from .api import PlayerApi
+from .models import Device, PlaybackState, Track
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# device flag icons indexed by flag value
+_ACTIVE = ("🔴", "🟢")
+_PRIVATE = ("🐵", "🙈")
+_RESTRICTED = ("🔓", "🔐")
+
+# playback state icons, flags indexed by flag value
+_SHUFFLE = ("🟦", "🔀")
+_PLAYING = ("⏸", "▶️")
+_REPEAT = {"track": "🔂", "context": "🔁"}
+
+
+@lru_cache(maxsize=1)
+def _terminal_columns() -> int:
+    """Terminal width, queried once per process"""
+    import shutil
+
+    return shutil.get_terminal_size().columns
 
 
 class Player:
     def __init__(self):
         self.player = PlayerApi()
 
-    def _to_ms(self, time: datetime) -> int:
+    @staticmethod
+    def _to_ms(time: "datetime") -> int:
         """Parses a datetime object into milliseconds
 
         Args:
@@ -18,10 +42,10 @@ class Player:
         Returns:
             int: numerical equivalent of the time in milliseconds
         """
-        seconds = time.hour * 60 * 60 + time.minute * 60 + time.second
-        return seconds * 1000
+        return time.hour * 3_600_000 + time.minute * 60_000 + time.second * 1000
 
-    def _format_time(self, time_ms: int) -> str:
+    @staticmethod
+    def _format_time(time_ms: int) -> str:
         """Parses milliseconds into formated time string
 
         Args:
@@ -30,11 +54,21 @@ class Player:
         Returns:
             str: string in correct format
         """
-        seconds = time_ms // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
+        minutes, seconds = divmod(time_ms // 1000, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
+    @staticmethod
+    def _song_by_artist(track: Track) -> str:
+        """Formats track as `artists - name`
+
+        Args:
+            track (Track): track to describe
+
+        Returns:
+            str: track description
+        """
+        return f"{' x '.join([artist.name for artist in track.artists])} - {track.name}"
+
     def _generate_progress_bar(self, duration_ms: int, progress_ms: int) -> str:
         """Generates progress bar that is adjusted to the terminal width
 
@@ -45,12 +79,12 @@ class Player:
         Returns:
             str: String representation of progress bar
         """
-        width: int = None
+        width: int | None = None
         fill: str = "█"
         empty: str = "-"
 
         if width is None:
-            width = int(shutil.get_terminal_size().columns * 0.1)
+            width = int(_terminal_columns() * 0.1)
 
         width = max(10, min(30, width))  # ensure that width is between 10 and 30
 
@@ -58,35 +92,61 @@ class Player:
 
         bar = width - 2
         filled_char = int(bar * progress)
-        empty_char = bar - filled_char
 
-        bar = fill * filled_char + empty * empty_char
+        bar = (fill * filled_char).ljust(bar, empty)
 
         current_time = self._format_time(progress_ms)
         total_time = self._format_time(duration_ms)
 
         return f"[{bar}] {current_time} / {total_time}"
 
-    def status_short(self) -> str:
-        """Displays short description about current device state
+    def _status_short_parts(self, state: PlaybackState | None) -> tuple[str, str]:
+        """Splits short description about given playback state into
+           playback icon and the rest of the description
+
+        Args:
+            state (PlaybackState | None): playback state to describe
 
         Returns:
-            str: string with current device state
+            tuple[str, str]: playback icon (empty if there is no state) and
+                description of current device state
         """
-        if not (state := self.player.get_playback_state()):
-            return "No active device found"
+        if not state:
+            return "", "No active device found"
 
         device = state.device
         song = state.item
-        is_playing = "▶️" if state.is_playing else "⏸"
+        is_playing = _PLAYING[state.is_playing]
 
-        artists = " x ".join(artist.name for artist in song.artists)
-        song_name = song.name
         volume = state.device.volume_percent
 
-        song_by_artist = f"{artists} - {song_name}"
+        song_by_artist = self._song_by_artist(song)
 
-        return f"{is_playing}  '{song_by_artist}' @ {device.name}[{device.id[:5]}] vol: {volume}%"
+        return (
+            is_playing,
+            f"'{song_by_artist}' @ {device.name}[{device.id[:5]}] vol: {volume}%",
+        )
+
+    def _format_status_short(self, state: PlaybackState | None) -> str:
+        """Formats short description about given playback state
+
+        Args:
+            state (PlaybackState | None): playback state to describe
+
+        Returns:
+            str: string with current device state
+        """
+        is_playing, description = self._status_short_parts(state)
+
+        return f"{is_playing}  {description}" if is_playing else description
+
+    def status_short(self) -> str:
+        """Displays short description about current device state
+
+        Returns:
+            str: string with current device state
+        """
+        return self._format_status_short(self.player.get_playback_state())
 
     def status(self) -> str:
         """Displays long description about current device state
@@ -99,25 +159,45 @@ class Player:
 
         song = state.item
         device = state.device
-        shuffle = "🔀" if state.shuffle_state else "🟦"
-        is_playing = "▶️" if state.is_playing else "⏸"
-        repeat = {"track": "🔂", "context": "🔁"}.get(state.repeat_state, "🟦")
+        shuffle = _SHUFFLE[state.shuffle_state]
+        is_playing = _PLAYING[state.is_playing]
+        repeat = _REPEAT.get(state.repeat_state, "🟦")
         volume = state.device.volume_percent
 
-        artists = " x ".join(artist.name for artist in song.artists)
-        song_name = song.name
-
-        song_by_artist = f"{artists} - {song_name}"
+        song_by_artist = self._song_by_artist(song)
         progress_bar = self._generate_progress_bar(
             duration_ms=song.duration_ms, progress_ms=state.progress_ms
         )
 
         return (
             f"\ndevice: {device.name}[{device.id[:5]}]\n"
-            + f"{song_by_artist}\n"
-            + f"{shuffle} {repeat} {is_playing}  {progress_bar} vol: {volume}%\n"
+            f"{song_by_artist}\n"
+            f"{shuffle} {repeat} {is_playing}  {progress_bar} vol: {volume}%\n"
         )
 
+    def _write_and_state(
+        self, write: Callable[[], Any], id: str = None
+    ) -> PlaybackState | None:
+        """Sends given write and fetches playback state. Without target device
+        both run concurrently, as the playback icon of fetched state is replaced
+        by the caller anyway; with one the write transfers playback, so state
+        is fetched after it to describe the target device
+
+        Args:
+            write (Callable[[], Any]): call sending the write request
+            id (str, optional): device id targeted by the write. Defaults to None.
+
+        Returns:
+            PlaybackState | None: playback state
+        """
+        if id:
+            write()
+            return self.player.get_playback_state()
+
+        _, state = gather(write, self.player.get_playback_state)
+
+        return state
+
     def play(self, id: str = None) -> str:
         """Calls spotify api to start playback on given device.
            If no id is given then targets current active device.
@@ -128,11 +208,12 @@ class Player:
         Returns:
             str: current song
         """
-        self.player.start_resume_playback(id)
+        state = self._write_and_state(lambda: self.player.start_resume_playback(id), id)
+        _, description = self._status_short_parts(state)
 
         result = "▶️" if not id else f"on [{id[:5]}] ▶️"
 
-        return result + self.status_short()[1:]
+        return f"{result}  {description}"
 
     def pause(self, id: str = None) -> str:
         """Calls spotify api to pause playback on given device.
@@ -144,11 +225,12 @@ class Player:
         Returns:
             str: current song
         """
-        self.player.pause_playback(id)
+        state = self._write_and_state(lambda: self.player.pause_playback(id), id)
+        _, description = self._status_short_parts(state)
 
         result = "⏸" if not id else f"on [{id[:5]}] ⏸"
 
-        return result + self.status_short()[1:]
+        return f"{result}  {description}"
 
     def next(self, id: str = None) -> str:
         """Calls spotify api to start next song on given device.
@@ -164,7 +246,7 @@ class Player:
 
         return "Playing next song" + (f" on device [{id[:5]}]" if id else "")
 
-    def previous(self, id: str = None):
+    def previous(self, id: str = None) -> str:
         """Calls spotify api to start previous song on given device.
            If no id is given then targets current active device.
 
@@ -193,7 +275,7 @@ class Player:
 
         return f"Setting volume to {value}%" + (f" on device [{id[:5]}]" if id else "")
 
-    def seek(self, time: datetime, id: str = None) -> str:
+    def seek(self, time: "datetime", id: str = None) -> str:
         """Seeks to the given position in the user's currently playing track.
            If the specified time is outside the range of the song,
            it will jump to the next one
@@ -205,6 +287,7 @@ class Player:
         Returns:
             str: Information about current song playing
         """
+        # sequential, seeking past the end switches the track shown in status
         self.player.seek_to_position(self._to_ms(time), id)
 
         return self.status_short()
@@ -226,28 +309,45 @@ class Player:
 
         return f"repeat mode set to: {value}"
 
-    def devices(self) -> dict[int, tuple[str, str]]:
-        """Get information about a user's available Spotify Connect devices
+    def _format_devices(self, devices: list[Device]) -> list[tuple[str, str]]:
+        """Formats given Spotify Connect devices
+
+        Args:
+            devices (list[Device]): devices to describe
 
         Returns:
-            dict[int, tuple[str, str]]: dict[num : (device id, device description)]
+            list[tuple[str, str]]: list[(device id, device description)],
+                device number `n` is at index `n - 1`
         """
-        devices = {}
-
-        for i, device in enumerate(self.player.get_available_devices(), start=1):
-            id = device.id
-            active = "🟢" if device.is_active else "🔴"
-            private = "🙈" if device.is_private_session else "🐵"
-            restricted = "🔐" if device.is_restricted else "🔓"
-            name = device.name
-            device_type = device.type
-
-            devices[i] = (
-                id,
-                f"({i}) {active} [{id}] {private} {restricted} {name} @ {device_type}",
+        return [
+            (
+                device.id,
+                f"({i}) {_ACTIVE[device.is_active]} [{device.id}] "
+                f"{_PRIVATE[device.is_private_session]} "
+                f"{_RESTRICTED[device.is_restricted]} {device.name} @ {device.type}",
             )
+            for i, device in enumerate(devices or [], start=1)
+        ]
 
-        return devices
+    def devices(self) -> list[tuple[str, str]]:
+        """Get information about a user's available Spotify Connect devices
+
+        Returns:
+            list[tuple[str, str]]: list[(device id, device description)]
+        """
+        return self._format_devices(self.player.get_available_devices())
+
+    def devices_with_status(self) -> tuple[str, list[tuple[str, str]]]:
+        """Get current device state together with user's available
+           Spotify Connect devices, fetching both concurrently
+
+        Returns:
+            tuple[str, list[tuple[str, str]]]: short status and
+                list[(device id, device description)]
+        """
+        state, devices = self.player.get_state_and_devices()
+
+        return self._format_status_short(state), self._format_devices(devices)
 
     def transfer(self, id: str) -> str:
         """Transfer playback to a new device
@@ -263,7 +363,8 @@ class Player:
         return f"Transferring playback to {id[:5]}"
 
     def shuffle(self, id: str = None) -> str:
-        """Toggle shuffle on or off for user's playback
+        """Toggle shuffle on or off for user's playback.
+           Reuses recently fetched playback state if there is one.
 
         Args:
             id (str, optional): device id to target while making api call. Defaults to None.
@@ -274,29 +375,47 @@ class Player:
         if not (state := self.player.get_playback_state()):
             return "No active device found"
 
-        shuffle_state = not state.shuffle_state
+        return self._set_shuffle(not state.shuffle_state, id)
+
+    def shuffle_on(self, id: str = None) -> str:
+        """Turn shuffle on for user's playback without reading current state
 
+        Args:
+            id (str, optional): device id to target while making api call. Defaults to None.
+
+        Returns:
+            str: Shuffle state set
+        """
+        return self._set_shuffle(True, id)
+
+    def shuffle_off(self, id: str = None) -> str:
+        """Turn shuffle off for user's playback without reading current state
+
+        Args:
+            id (str, optional): device id to target while making api call. Defaults to None.
+
+        Returns:
+            str: Shuffle state set
+        """
+        return self._set_shuffle(False, id)
+
+    def _set_shuffle(self, shuffle_state: bool, id: str = None) -> str:
         self.player.toggle_playback_shuffle(shuffle_state, id)
 
         return f"Setting shuffle state to {shuffle_state}"
 
-    def queue(self) -> list[str]:
+    def queue(self) -> list[str] | None:
         """Get the list of objects that make up the user's queue
 
         Returns:
-            list[str]: List of tracks in queue
+            list[str] | None: List of tracks in queue
         """
         queue = self.player.get_user_queue()
 
         if not queue:
             return None
 
-        queue = [
-            " x ".join(artist.name for artist in q.artists) + " - " + q.name
-            for q in queue
-        ]
-
-        return queue
+        return [self._song_by_artist(track) for track in queue]
 
     def add_queue(self, uri: SpotifyURI, id: str = None) -> str:
         """Add an item to the end of the user's current playback queue
@@ -321,13 +440,7 @@ class Player:
         Returns:
             list[str]: List of tracks
         """
-        result = self.player.get_recently_played_tracks(limit)
-
-        songs = []
-
-        for track in result:
-            artists = " x ".join(artist.name for artist in track.artists)
-            song_name = track.name
-            songs += [f"{artists} - {song_name}"]
+        if not (result := self.player.get_recently_played_tracks(limit)):
+            return []
 
-        return songs
+        return [self._song_by_artist(track) for track in result]
@@ -0,0 +1,102 @@
+import pytest
+
+from spotli.player import api
+from spotli.player.api import PlayerApi
+
+DEVICE_ID = "0d1841b0976bae2a3a310dd74c0f3df354899bc8"
+TRACK_URI = "spotify:track:6rqhFgbbKwnb9MLmUQDhG6"
+
+# documented query / body parameters of Spotify Web API player endpoints
+DOCUMENTED = {
+    ("PUT", "me/player"): {"device_ids", "play"},
+    ("PUT", "me/player/play"): {
+        "device_id",
+        "context_uri",
+        "uris",
+        "offset",
+        "position_ms",
+    },
+    ("PUT", "me/player/pause"): {"device_id"},
+    ("POST", "me/player/next"): {"device_id"},
+    ("POST", "me/player/previous"): {"device_id"},
+    ("PUT", "me/player/seek"): {"position_ms", "device_id"},
+    ("PUT", "me/player/repeat"): {"state", "device_id"},
+    ("PUT", "me/player/volume"): {"volume_percent", "device_id"},
+    ("PUT", "me/player/shuffle"): {"state", "device_id"},
+    ("GET", "me/player/recently-played"): {"limit", "after", "before"},
+    ("POST", "me/player/queue"): {"uri", "device_id"},
+}
+
+
+class FakeSpotifyAPI:
+    """Records requests instead of sending them"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _record(self, method, endpoint, data=None, params=None):
+        self.calls.append((method, endpoint, data or {}, params or {}))
+
+    def get(self, endpoint, data=None, params=None):
+        self._record("GET", endpoint, data, params)
+
+    def get_many(self, calls):
+        return [self.get(endpoint, params=params) for endpoint, params in calls]
+
+    def post(self, endpoint, data=None, params=None):
+        self._record("POST", endpoint, data, params)
+
+    def put(self, endpoint, data=None, params=None):
+        self._record("PUT", endpoint, data, params)
+
+
+@pytest.fixture
+def player_api(monkeypatch):
+    monkeypatch.setattr(api, "SpotifyAPI", FakeSpotifyAPI)
+    return PlayerApi()
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda p: p.transfer_playback(DEVICE_ID),
+        lambda p: p.start_resume_playback(DEVICE_ID),
+        lambda p: p.pause_playback(DEVICE_ID),
+        lambda p: p.skip_to_next(DEVICE_ID),
+        lambda p: p.skip_to_previous(DEVICE_ID),
+        lambda p: p.seek_to_position(1000, DEVICE_ID),
+        lambda p: p.set_repeat_mode("track", DEVICE_ID),
+        lambda p: p.set_playback_volume(50, DEVICE_ID),
+        lambda p: p.toggle_playback_shuffle(True, DEVICE_ID),
+        lambda p: p.get_recently_played_tracks(10),
+        lambda p: p.add_item_to_queue(TRACK_URI, DEVICE_ID),
+    ],
+)
+def test_sends_only_documented_parameters(player_api, call):
+    call(player_api)
+
+    ((method, endpoint, data, params),) = player_api.spotify_api.calls
+
+    assert set(data) | set(params) <= DOCUMENTED[(method, endpoint)]
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda p: p.start_resume_playback(DEVICE_ID),
+        lambda p: p.pause_playback(DEVICE_ID),
+        lambda p: p.skip_to_next(DEVICE_ID),
+        lambda p: p.skip_to_previous(DEVICE_ID),
+        lambda p: p.seek_to_position(1000, DEVICE_ID),
+        lambda p: p.set_repeat_mode("track", DEVICE_ID),
+        lambda p: p.set_playback_volume(50, DEVICE_ID),
+        lambda p: p.toggle_playback_shuffle(True, DEVICE_ID),
+        lambda p: p.add_item_to_queue(TRACK_URI, DEVICE_ID),
+    ],
+)
+def test_targets_given_device(player_api, call):
+    call(player_api)
+
+    ((_, _, _, params),) = player_api.spotify_api.calls
+
+    assert params["device_id"] == DEVICE_ID